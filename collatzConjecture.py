@@ -1,4 +1,164 @@
-def collatzSteps(n):
+import heapq
+import json
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch functions fall back to pure Python
+    np = None
+
+# On-disk stopping-time index: magic, version, block size, first value,
+# value count and block count, padded to 40 bytes; all fields little-endian
+_INDEX_MAGIC = b'CLZI'
+_INDEX_VERSION = 1
+_INDEX_HEADER = struct.Struct('<4sHxxIQQQ4x')
+
+# Format version of findMaxStepsResumable checkpoint files
+_CHECKPOINT_VERSION = 1
+
+# Jump tables for collatzStepsAccelerated, keyed by the number of bits k
+_JUMP_TABLES = {}
+
+# Largest odd int64 value whose 3 * n + 1 still fits in int64
+_INT64_ODD_LIMIT = (2 ** 63 - 2) // 3
+
+
+class CollatzCache:
+    """
+    Bounded memoization cache for Collatz step counts.
+
+    Values below table_size are stored in a flat uint16 array (index = value,
+    0 = unknown), larger intermediate values go into an LRU dictionary that
+    holds at most max_entries items. Memory use is therefore capped at about
+    2 * table_size bytes plus the dictionary.
+
+    Args:
+        table_size (int): Values below this bound use the array table
+        max_entries (int): Maximum number of values kept in the LRU dictionary
+    """
+
+    def __init__(self, table_size=1 << 20, max_entries=1 << 16):
+        if table_size < 2 or max_entries < 0:
+            raise ValueError("table_size must be >= 2 and max_entries >= 0")
+        self.table_size = table_size
+        self.max_entries = max_entries
+        self._table = array('H', bytes(2 * table_size))
+        self._overflow = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, n):
+        """
+        Look up the cached step count for n.
+
+        Args:
+            n (int): Positive integer
+
+        Returns:
+            int or None: Cached step count, or None if n is not cached
+        """
+        if n == 1:
+            return 0
+        if n < self.table_size:
+            steps = self._table[n]
+            if steps:
+                self.hits += 1
+                return steps
+        else:
+            steps = self._overflow.get(n)
+            if steps is not None:
+                self._overflow.move_to_end(n)
+                self.hits += 1
+                return steps
+        self.misses += 1
+        return None
+
+    def put(self, n, steps):
+        """
+        Store the step count for n, evicting the least recently used large
+        value if the dictionary is full.
+
+        Args:
+            n (int): Positive integer
+            steps (int): Number of steps for n to reach 1
+        """
+        if n < self.table_size:
+            # Step counts of table-sized values always fit in uint16
+            self._table[n] = steps
+        elif self.max_entries:
+            self._overflow[n] = steps
+            self._overflow.move_to_end(n)
+            if len(self._overflow) > self.max_entries:
+                self._overflow.popitem(last=False)
+                self.evictions += 1
+
+    def steps(self, n):
+        """
+        Calculate the number of Collatz steps for n, reusing and filling the
+        cache along the trajectory.
+
+        Args:
+            n (int): Starting positive integer
+
+        Returns:
+            int: Number of steps to reach 1
+
+        Raises:
+            ValueError: If n is not a positive integer
+        """
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError("Input must be a positive integer")
+
+        # Walk forward until we reach a value whose step count is known
+        path = []
+        known = self.get(n)
+        while known is None:
+            path.append(n)
+            if n % 2 == 0:
+                n = n // 2
+            else:
+                n = 3 * n + 1
+            known = self.get(n)
+
+        # Unwind the path, each value is one step further from 1
+        for value in reversed(path):
+            known += 1
+            self.put(value, known)
+
+        return known
+
+    def stats(self):
+        """
+        Report cache counters for sizing.
+
+        Returns:
+            dict: hits, misses, evictions and current dictionary size
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'table_size': self.table_size,
+            'overflow_entries': len(self._overflow),
+        }
+
+    def clear(self):
+        """
+        Drop all cached values and reset the counters.
+        """
+        self._table = array('H', bytes(2 * self.table_size))
+        self._overflow.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+def collatzSteps(n, cache=None):
     """
     Calculate the number of steps to reach 1 using the Collatz conjecture rules.
     
@@ -8,6 +168,7 @@ def collatzSteps(n):
     
     Args:
         n (int): Starting positive integer
+        cache (CollatzCache, optional): Memoization cache to read and fill
         
     Returns:
         int: Number of steps to reach 1
@@ -18,6 +179,9 @@ def collatzSteps(n):
     if not isinstance(n, int) or n <= 0:
         raise ValueError("Input must be a positive integer")
     
+    if cache is not None:
+        return cache.steps(n)
+    
     if n == 1:
         return 0
     
@@ -32,12 +196,14 @@ def collatzSteps(n):
     return steps
 
 
-def collatzSequence(n):
+def collatzSequence(n, cache=None):
     """
     Generate the complete Collatz sequence for a given number.
     
     Args:
         n (int): Starting positive integer
+        cache (CollatzCache, optional): Cache to fill with the step count
+            of every value in the sequence
         
     Returns:
         list: Complete sequence from n to 1
@@ -48,15 +214,130 @@ def collatzSequence(n):
     if not isinstance(n, int) or n <= 0:
         raise ValueError("Input must be a positive integer")
     
-    sequence = [n]
+    sequence = list(_sequenceValues(n))
+    
+    if cache is not None:
+        # The i-th value is len(sequence) - 1 - i steps away from 1
+        last = len(sequence) - 1
+        for i, value in enumerate(sequence):
+            cache.put(value, last - i)
+    
+    return sequence
+
+
+def _sequenceValues(n):
+    yield n
     while n != 1:
         if n % 2 == 0:
             n = n // 2
         else:
             n = 3 * n + 1
-        sequence.append(n)
+        yield n
+
+
+def iterCollatzSequence(n):
+    """
+    Lazily generate the Collatz sequence for a given number.
     
-    return sequence
+    Only the current value is kept in memory, so trajectories of huge
+    starting values can be consumed without building a list.
+    
+    Args:
+        n (int): Starting positive integer
+        
+    Returns:
+        generator: Values of the sequence from n down to 1
+        
+    Raises:
+        ValueError: If n is not a positive integer
+    """
+    if not isinstance(n, int) or n <= 0:
+        raise ValueError("Input must be a positive integer")
+    
+    return _sequenceValues(n)
+
+
+def writeCollatzSequence(n, target, chunk_size=1024):
+    """
+    Stream the Collatz sequence to a file or callback in fixed-size chunks.
+    
+    Args:
+        n (int): Starting positive integer
+        target (str, file or callable): Path to write to, an open text file,
+            or a function called with each list of at most chunk_size values
+        chunk_size (int): Number of values buffered before each write
+        
+    Returns:
+        int: Number of values written (steps + 1)
+        
+    Raises:
+        ValueError: If n is not a positive integer or chunk_size < 1
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    values = iterCollatzSequence(n)
+    
+    if isinstance(target, str):
+        with open(target, 'w') as output:
+            return writeCollatzSequence(n, output, chunk_size)
+    
+    if callable(target):
+        emit = target
+    else:
+        def emit(chunk):
+            target.write('\n'.join(map(str, chunk)))
+            target.write('\n')
+    
+    count = 0
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == chunk_size:
+            emit(chunk)
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        emit(chunk)
+        count += len(chunk)
+    
+    return count
+
+
+def collatzSummary(n):
+    """
+    Summarize a Collatz trajectory in a single pass without storing it.
+    
+    Args:
+        n (int): Starting positive integer
+        
+    Returns:
+        dict: steps, peak (largest value reached), even_steps and odd_steps
+        
+    Raises:
+        ValueError: If n is not a positive integer
+    """
+    if not isinstance(n, int) or n <= 0:
+        raise ValueError("Input must be a positive integer")
+    
+    peak = n
+    even_steps = 0
+    odd_steps = 0
+    while n != 1:
+        if n % 2 == 0:
+            n = n // 2
+            even_steps += 1
+        else:
+            n = 3 * n + 1
+            odd_steps += 1
+            if n > peak:
+                peak = n
+    
+    return {
+        'steps': even_steps + odd_steps,
+        'peak': peak,
+        'even_steps': even_steps,
+        'odd_steps': odd_steps,
+    }
 
 
 def collatzStepsRecursive(n, steps=0):
@@ -84,12 +365,82 @@ def collatzStepsRecursive(n, steps=0):
         return collatzStepsRecursive(3 * n + 1, steps + 1)
 
 
-def findMaxSteps(limit):
+def _jumpTable(k):
+    """
+    Build (or fetch) the k-bit jump table.
+    
+    For n = q * 2^k + r, applying the shortcut map T(x) = x / 2 (even) or
+    (3x + 1) / 2 (odd) k times gives 3^c * q + T^k(r), where c is the number
+    of odd steps taken by r. Entry r holds (3^c, T^k(r), k + c), the last
+    value being the number of ordinary Collatz steps covered by the jump.
+    """
+    table = _JUMP_TABLES.get(k)
+    if table is None:
+        table = []
+        for r in range(1 << k):
+            x = r
+            odd_steps = 0
+            for _ in range(k):
+                if x & 1:
+                    x = (3 * x + 1) >> 1
+                    odd_steps += 1
+                else:
+                    x >>= 1
+            table.append((3 ** odd_steps, x, k + odd_steps))
+        _JUMP_TABLES[k] = table
+    return table
+
+
+def collatzStepsAccelerated(n, k=16):
+    """
+    Fast Collatz step count for very large starting values.
+    
+    Runs of halvings are removed in one shift using the trailing-zero count,
+    and a precomputed k-bit jump table advances k shortcut steps per
+    iteration. Returns exactly the same count as collatzSteps.
+    
+    Args:
+        n (int): Starting positive integer
+        k (int): Bits per jump (table has 2^k entries, built once and cached)
+        
+    Returns:
+        int: Number of steps to reach 1
+        
+    Raises:
+        ValueError: If n is not a positive integer or k is not positive
+    """
+    if not isinstance(n, int) or n <= 0:
+        raise ValueError("Input must be a positive integer")
+    if k <= 0:
+        raise ValueError("k must be a positive integer")
+    
+    table = _jumpTable(k)
+    mask = (1 << k) - 1
+    threshold = 1 << k
+    steps = 0
+    
+    # While n >= 2^k no jump can pass through 1 before its last step
+    while n >= threshold:
+        if not n & 1:
+            zeros = (n & -n).bit_length() - 1
+            n >>= zeros
+            steps += zeros
+            continue
+        multiplier, adder, jump = table[n & mask]
+        n = multiplier * (n >> k) + adder
+        steps += jump
+    
+    return steps + collatzSteps(n)
+
+
+def findMaxSteps(limit, cache=None):
     """
     Find the number (up to limit) that takes the most steps to reach 1.
     
     Args:
         limit (int): Upper limit to check
+        cache (CollatzCache, optional): Memoization cache shared by all
+            trajectories, makes large scans much faster
         
     Returns:
         tuple: (number, max_steps)
@@ -98,7 +449,7 @@ def findMaxSteps(limit):
     max_number = 1
     
     for i in range(1, limit + 1):
-        steps = collatzSteps(i)
+        steps = collatzSteps(i, cache)
         if steps > max_steps:
             max_steps = steps
             max_number = i
@@ -106,6 +457,581 @@ def findMaxSteps(limit):
     return max_number, max_steps
 
 
+def collatzStepsBatch(values):
+    """
+    Calculate Collatz step counts for many starting values at once.
+    
+    With NumPy available, all values are advanced together as an int64 array:
+    every iteration applies the even/odd rules through masks and retires the
+    lanes that reached 1. Lanes whose next 3 * n + 1 would overflow int64 are
+    finished with collatzSteps on Python ints. Without NumPy each value is
+    passed to collatzSteps.
+    
+    Args:
+        values (iterable): Positive integers that fit in int64 (list,
+            array.array or NumPy array)
+        
+    Returns:
+        numpy.ndarray or array.array: int64 step counts in input order
+        
+    Raises:
+        ValueError: If any value is not a positive integer
+    """
+    if np is None:
+        return array('q', (collatzSteps(v) for v in values))
+    
+    values = np.asarray(values)
+    if not values.size:
+        values = values.astype(np.int64)
+    elif values.dtype.kind not in 'iu':
+        raise ValueError("Input must be a positive integer")
+    values = values.astype(np.int64).ravel()
+    if values.size and values.min() <= 0:
+        raise ValueError("Input must be a positive integer")
+    
+    steps = np.zeros(values.size, dtype=np.int64)
+    lanes = np.flatnonzero(values != 1)
+    current = values[lanes]
+    iteration = 0
+    
+    while lanes.size:
+        odd = (current & 1).astype(bool)
+        
+        # Hand lanes that would overflow over to exact Python arithmetic
+        overflow = odd & (current > _INT64_ODD_LIMIT)
+        if overflow.any():
+            for lane, value in zip(lanes[overflow], current[overflow]):
+                steps[lane] = iteration + collatzSteps(int(value))
+            keep = ~overflow
+            lanes, current, odd = lanes[keep], current[keep], odd[keep]
+        
+        current = np.where(odd, 3 * current + 1, current >> 1)
+        iteration += 1
+        
+        # Retire lanes that reached 1
+        done = current == 1
+        if done.any():
+            steps[lanes[done]] = iteration
+            keep = ~done
+            lanes, current = lanes[keep], current[keep]
+    
+    return steps
+
+
+def buildCollatzIndex(path, start, end, block_size=4096, cache=None):
+    """
+    Write the step counts of every value in [start, end] to a binary index.
+    
+    The file holds a header, the maximum step count of each block of
+    block_size values, and one uint16 step count per value.
+    
+    Args:
+        path (str): File to create (overwritten if it exists)
+        start (int): First value (inclusive, positive)
+        end (int): Last value (inclusive)
+        block_size (int): Values per block summary
+        cache (CollatzCache, optional): Cache used while computing steps
+            (a default-sized one is created if omitted)
+        
+    Returns:
+        int: Number of values written
+        
+    Raises:
+        ValueError: If the range is empty or invalid, or a step count does
+            not fit in uint16
+    """
+    if not isinstance(start, int) or start <= 0 or end < start:
+        raise ValueError("Range must be non-empty and start positive")
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer")
+    if cache is None:
+        cache = CollatzCache()
+    
+    count = end - start + 1
+    block_count = (count + block_size - 1) // block_size
+    maxima = array('H')
+    
+    with open(path, 'wb') as output:
+        output.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, block_size,
+                                        start, count, block_count))
+        # Reserve room for the block maxima, filled in once they are known
+        output.write(bytes(2 * block_count))
+        
+        for block_start in range(start, end + 1, block_size):
+            block_end = min(block_start + block_size, end + 1)
+            try:
+                block = array('H', [cache.steps(i) for i in range(block_start, block_end)])
+            except OverflowError:
+                raise ValueError("Step count does not fit in uint16") from None
+            maxima.append(max(block))
+            if sys.byteorder != 'little':
+                block.byteswap()
+            output.write(block.tobytes())
+        
+        if sys.byteorder != 'little':
+            maxima.byteswap()
+        output.seek(_INDEX_HEADER.size)
+        output.write(maxima.tobytes())
+    
+    return count
+
+
+class CollatzIndex:
+    """
+    Read-only, memory-mapped view of a file written by buildCollatzIndex.
+    
+    Point lookups read a single uint16, range maxima use the per-block
+    summaries and only scan the partial blocks at both ends of the range.
+    
+    Args:
+        path (str): Index file to open
+        
+    Raises:
+        ValueError: If the file is not a valid index
+    """
+    
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise ValueError("CollatzIndex requires a little-endian host")
+        with open(path, 'rb') as source:
+            self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        header_size = _INDEX_HEADER.size
+        if len(self._map) < header_size:
+            self._map.close()
+            raise ValueError("Not a Collatz index file")
+        magic, version, self.block_size, self.start, self.count, block_count = \
+            _INDEX_HEADER.unpack_from(self._map)
+        values_offset = header_size + 2 * block_count
+        if (magic != _INDEX_MAGIC or version != _INDEX_VERSION
+                or len(self._map) != values_offset + 2 * self.count):
+            self._map.close()
+            raise ValueError("Not a Collatz index file")
+        
+        self.end = self.start + self.count - 1
+        view = memoryview(self._map)
+        self._maxima = view[header_size:values_offset].cast('H')
+        self._values = view[values_offset:].cast('H')
+        view.release()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """
+        Release the memory map.
+        """
+        if self._map is not None:
+            self._maxima.release()
+            self._values.release()
+            self._map.close()
+            self._map = None
+    
+    def _offset(self, n):
+        if not isinstance(n, int) or not self.start <= n <= self.end:
+            raise ValueError(f"Value must be an integer in [{self.start}, {self.end}]")
+        return n - self.start
+    
+    def steps(self, n):
+        """
+        Look up the number of steps for n to reach 1.
+        
+        Args:
+            n (int): Value covered by the index
+            
+        Returns:
+            int: Number of steps to reach 1
+        """
+        return self._values[self._offset(n)]
+    
+    def maxSteps(self, start, end):
+        """
+        Find the value in [start, end] that takes the most steps to reach 1.
+        Ties go to the smallest value, like findMaxSteps.
+        
+        Args:
+            start (int): First value (inclusive)
+            end (int): Last value (inclusive)
+            
+        Returns:
+            tuple: (number, max_steps)
+        """
+        lo = self._offset(start)
+        hi = self._offset(end) + 1
+        if hi <= lo:
+            raise ValueError("Range must not be empty")
+        size = self.block_size
+        values = self._values
+        
+        # Candidate segments in ascending order: head, full blocks, tail
+        best_steps = -1
+        best_segment = None
+        first_block = -(-lo // size)
+        last_block = hi // size
+        if first_block >= last_block:
+            segments = [(lo, hi)]
+        else:
+            segments = [(lo, first_block * size), None, (last_block * size, hi)]
+        
+        for segment in segments:
+            if segment is None:
+                block_max = max(self._maxima[first_block:last_block])
+                if block_max > best_steps:
+                    block = first_block + self._maxima[first_block:last_block].tolist().index(block_max)
+                    best_steps = block_max
+                    best_segment = (block * size, (block + 1) * size)
+            elif segment[0] < segment[1]:
+                segment_max = max(values[segment[0]:segment[1]])
+                if segment_max > best_steps:
+                    best_steps = segment_max
+                    best_segment = segment
+        
+        seg_lo, seg_hi = best_segment
+        position = seg_lo + values[seg_lo:seg_hi].tolist().index(best_steps)
+        return self.start + position, best_steps
+
+
+class CollatzStats:
+    """
+    Mergeable, constant-memory statistics over Collatz trajectories.
+    
+    Keeps a histogram of stopping times (its size is bounded by the number of
+    distinct step counts, not by the number of values), the top_k longest
+    trajectories, and the highest peak value reached. Exact percentiles are
+    read off the histogram. Instances from different chunks or processes can
+    be combined with merge().
+    
+    Args:
+        top_k (int): Number of longest trajectories to keep
+    """
+    
+    def __init__(self, top_k=10):
+        if top_k < 0:
+            raise ValueError("top_k must be a non-negative integer")
+        self.top_k = top_k
+        self.count = 0
+        self.total_steps = 0
+        self.histogram = {}
+        self.peak_value = None
+        self.peak_number = None
+        # Min-heap of (steps, -number): the root is the weakest entry kept
+        self._top = []
+    
+    def add(self, number, steps, peak=None):
+        """
+        Record one starting value.
+        
+        Args:
+            number (int): Starting value
+            steps (int): Its number of steps to reach 1
+            peak (int, optional): Highest value reached by its trajectory
+        """
+        self.count += 1
+        self.total_steps += steps
+        self.histogram[steps] = self.histogram.get(steps, 0) + 1
+        
+        if peak is not None and (self.peak_value is None or peak > self.peak_value
+                                 or (peak == self.peak_value and number < self.peak_number)):
+            self.peak_value = peak
+            self.peak_number = number
+        
+        if self.top_k:
+            entry = (steps, -number)
+            if len(self._top) < self.top_k:
+                heapq.heappush(self._top, entry)
+            elif entry > self._top[0]:
+                heapq.heapreplace(self._top, entry)
+    
+    def merge(self, other):
+        """
+        Fold the statistics of another instance into this one.
+        
+        Args:
+            other (CollatzStats): Statistics over a disjoint set of values
+            
+        Returns:
+            CollatzStats: self
+        """
+        self.count += other.count
+        self.total_steps += other.total_steps
+        for steps, count in other.histogram.items():
+            self.histogram[steps] = self.histogram.get(steps, 0) + count
+        
+        if other.peak_value is not None and (
+                self.peak_value is None or other.peak_value > self.peak_value
+                or (other.peak_value == self.peak_value and other.peak_number < self.peak_number)):
+            self.peak_value = other.peak_value
+            self.peak_number = other.peak_number
+        
+        self._top = heapq.nlargest(self.top_k, self._top + other._top)
+        heapq.heapify(self._top)
+        return self
+    
+    def topK(self):
+        """
+        Longest trajectories seen, longest first (smaller number on ties).
+        
+        Returns:
+            list: (number, steps) tuples
+        """
+        return [(-negated, steps) for steps, negated in sorted(self._top, reverse=True)]
+    
+    def mean(self):
+        """
+        Average number of steps, or 0.0 if nothing was recorded.
+        """
+        return self.total_steps / self.count if self.count else 0.0
+    
+    def percentile(self, p):
+        """
+        Exact percentile of the stopping times (nearest-rank method).
+        
+        Args:
+            p (float): Percentile between 0 and 100
+            
+        Returns:
+            int: Smallest step count with at least p% of values at or below it
+            
+        Raises:
+            ValueError: If p is out of range or nothing was recorded
+        """
+        if not 0 <= p <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        if not self.count:
+            raise ValueError("No values recorded")
+        
+        rank = max(1, -(-p * self.count // 100))
+        seen = 0
+        for steps in sorted(self.histogram):
+            seen += self.histogram[steps]
+            if seen >= rank:
+                return steps
+        return steps
+    
+    def toDict(self):
+        """
+        Export the statistics as a JSON-serializable dictionary.
+        
+        Returns:
+            dict: State that fromDict can restore
+        """
+        return {
+            'top_k': self.top_k,
+            'count': self.count,
+            'total_steps': self.total_steps,
+            'histogram': [[steps, count] for steps, count in sorted(self.histogram.items())],
+            'peak_value': self.peak_value,
+            'peak_number': self.peak_number,
+            'top': [[-negated, steps] for steps, negated in self._top],
+        }
+    
+    @classmethod
+    def fromDict(cls, data):
+        """
+        Rebuild statistics exported with toDict.
+        
+        Args:
+            data (dict): Output of toDict
+            
+        Returns:
+            CollatzStats: Restored statistics
+        """
+        stats = cls(data['top_k'])
+        stats.count = data['count']
+        stats.total_steps = data['total_steps']
+        stats.histogram = {steps: count for steps, count in data['histogram']}
+        stats.peak_value = data['peak_value']
+        stats.peak_number = data['peak_number']
+        stats._top = [(steps, -number) for number, steps in data['top']]
+        heapq.heapify(stats._top)
+        return stats
+
+
+def collatzRangeStats(start, end, top_k=10, track_peak=True, cache=None):
+    """
+    Collect CollatzStats over every value in [start, end] in one pass.
+    
+    Args:
+        start (int): First value (inclusive, positive)
+        end (int): Last value (inclusive)
+        top_k (int): Number of longest trajectories to keep
+        track_peak (bool): Follow every trajectory to record peak values;
+            when False the cache is used and peaks are not reported
+        cache (CollatzCache, optional): Cache used when track_peak is False
+        
+    Returns:
+        CollatzStats: Statistics for the range
+        
+    Raises:
+        ValueError: If start is not a positive integer
+    """
+    if not isinstance(start, int) or start <= 0:
+        raise ValueError("Input must be a positive integer")
+    
+    stats = CollatzStats(top_k)
+    for i in range(start, end + 1):
+        if track_peak:
+            summary = collatzSummary(i)
+            stats.add(i, summary['steps'], summary['peak'])
+        else:
+            stats.add(i, collatzSteps(i, cache))
+    
+    return stats
+
+
+def _writeCheckpoint(path, state):
+    # Write to a temporary file first so a crash never leaves a torn checkpoint
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as output:
+        json.dump(state, output)
+        output.flush()
+        os.fsync(output.fileno())
+    os.replace(temporary, path)
+
+
+def findMaxStepsResumable(limit, checkpoint_path, interval=1000000,
+                          collect_stats=False, top_k=10, cache=None):
+    """
+    findMaxSteps that periodically saves its progress and can be resumed.
+    
+    Every interval numbers the current position, the best (number, steps)
+    so far and, optionally, the accumulated CollatzStats are written to
+    checkpoint_path. Calling the function again with the same arguments
+    continues from the last checkpoint and gives identical results. The
+    checkpoint is kept after completion, so a finished scan returns
+    immediately; delete the file to start over.
+    
+    Args:
+        limit (int): Upper limit to check
+        checkpoint_path (str): Checkpoint file to create or resume from
+        interval (int): Numbers scanned between checkpoints
+        collect_stats (bool): Also accumulate CollatzStats (without peaks)
+        top_k (int): Number of longest trajectories kept in the statistics
+        cache (CollatzCache, optional): Cache used for the step counts
+            (a default-sized one is created if omitted)
+        
+    Returns:
+        tuple: (number, max_steps), or (number, max_steps, stats) when
+        collect_stats is True
+        
+    Raises:
+        ValueError: If interval is not positive or the checkpoint belongs to
+            a scan with different arguments
+    """
+    if interval < 1:
+        raise ValueError("interval must be a positive integer")
+    if cache is None:
+        cache = CollatzCache()
+    
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as source:
+            state = json.load(source)
+        if (state.get('version') != _CHECKPOINT_VERSION or state['limit'] != limit
+                or state['collect_stats'] != collect_stats
+                or (collect_stats and state['stats']['top_k'] != top_k)):
+            raise ValueError("Checkpoint does not match this scan")
+        position = state['next']
+        max_number = state['max_number']
+        max_steps = state['max_steps']
+        stats = CollatzStats.fromDict(state['stats']) if collect_stats else None
+    else:
+        position = 1
+        max_number = 1
+        max_steps = 0
+        stats = CollatzStats(top_k) if collect_stats else None
+    
+    while position <= limit:
+        stop = min(position + interval, limit + 1)
+        for i in range(position, stop):
+            steps = collatzSteps(i, cache)
+            if steps > max_steps:
+                max_steps = steps
+                max_number = i
+            if stats is not None:
+                stats.add(i, steps)
+        position = stop
+        
+        _writeCheckpoint(checkpoint_path, {
+            'version': _CHECKPOINT_VERSION,
+            'limit': limit,
+            'next': position,
+            'max_number': max_number,
+            'max_steps': max_steps,
+            'collect_stats': collect_stats,
+            'stats': stats.toDict() if stats is not None else None,
+        })
+    
+    if collect_stats:
+        return max_number, max_steps, stats
+    return max_number, max_steps
+
+
+# Per-process cache used by the findMaxStepsParallel workers
+_worker_cache = None
+
+
+def _initWorker(table_size):
+    global _worker_cache
+    _worker_cache = CollatzCache(table_size) if table_size else None
+
+
+def _maxStepsInChunk(bounds):
+    start, stop = bounds
+    max_steps = -1
+    max_number = start
+    for i in range(start, stop):
+        steps = collatzSteps(i, _worker_cache)
+        if steps > max_steps:
+            max_steps = steps
+            max_number = i
+    return max_number, max_steps
+
+
+def findMaxStepsParallel(limit, workers=None, chunk_size=None, table_size=1 << 20):
+    """
+    Multi-process version of findMaxSteps.
+    
+    The range is cut into many small chunks that idle workers pull from a
+    shared queue, so chunks with long trajectories do not leave other cores
+    waiting. Ties are resolved in favour of the smallest number, exactly like
+    findMaxSteps.
+    
+    Args:
+        limit (int): Upper limit to check
+        workers (int, optional): Number of processes (default: CPU count)
+        chunk_size (int, optional): Numbers per chunk (default: about
+            16 chunks per worker, capped at 100000)
+        table_size (int): Per-worker CollatzCache table size, 0 disables
+            memoization
+        
+    Returns:
+        tuple: (number, max_steps)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if limit < 2 or workers < 2:
+        return findMaxSteps(limit, CollatzCache(table_size) if table_size else None)
+    
+    if chunk_size is None:
+        chunk_size = max(1, min(100000, limit // (workers * 16)))
+    chunks = [(start, min(start + chunk_size, limit + 1))
+              for start in range(1, limit + 1, chunk_size)]
+    
+    max_steps = 0
+    max_number = 1
+    with multiprocessing.Pool(workers, _initWorker, (table_size,)) as pool:
+        for number, steps in pool.imap_unordered(_maxStepsInChunk, chunks):
+            # Chunks arrive in any order, so compare numbers on ties
+            if steps > max_steps or (steps == max_steps and number < max_number):
+                max_steps = steps
+                max_number = number
+    
+    return max_number, max_steps
+
+
 # Test the functions
 if __name__ == "__main__":
     test_numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 27, 100]
@@ -129,4 +1055,49 @@ if __name__ == "__main__":
     print("Finding number with maximum steps (up to 100):")
     max_num, max_steps = findMaxSteps(100)
     print(f"Number {max_num} takes {max_steps} steps to reach 1")
-    print(f"Sequence: {collatzSequence(max_num)}")
\ No newline at end of file
+    print(f"Sequence: {collatzSequence(max_num)}")
+    
+    # Memoized scan
+    print("\nFinding number with maximum steps (up to 100000, memoized):")
+    cache = CollatzCache(table_size=1 << 18)
+    max_num, max_steps = findMaxSteps(100000, cache)
+    print(f"Number {max_num} takes {max_steps} steps to reach 1")
+    print(f"Cache stats: {cache.stats()}")
+    
+    # Parallel scan
+    print("\nFinding number with maximum steps (up to 100000, parallel):")
+    max_num, max_steps = findMaxStepsParallel(100000)
+    print(f"Number {max_num} takes {max_steps} steps to reach 1")
+    
+    # Single-pass summary
+    print("\nSummary for 27:")
+    print(collatzSummary(27))
+    
+    # Huge starting value
+    print("\nAccelerated steps for 3^500 + 1:")
+    print(collatzStepsAccelerated(3 ** 500 + 1))
+    
+    # Range statistics
+    stats = collatzRangeStats(1, 10000, top_k=3)
+    print("\nStatistics for 1..10000:")
+    print(f"  Top 3: {stats.topK()}")
+    print(f"  Highest peak: {stats.peak_value} (from {stats.peak_number})")
+    print(f"  Median steps: {stats.percentile(50)}, 99th percentile: {stats.percentile(99)}")
+    
+    # Memory-mapped index and resumable scan
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint_path = os.path.join(directory, 'scan.json')
+        print("\nResumable scan (up to 100000):")
+        print(findMaxStepsResumable(100000, checkpoint_path, interval=25000))
+        
+        index_path = os.path.join(directory, 'collatz.idx')
+        buildCollatzIndex(index_path, 1, 100000)
+        with CollatzIndex(index_path) as index:
+            print("\nIndex lookups:")
+            print(f"  steps(27) = {index.steps(27)}")
+            print(f"  maxSteps(1, 100000) = {index.maxSteps(1, 100000)}")
+    
+    # Batch step counts
+    print("\nBatch step counts for 1..10:")
+    print([int(steps) for steps in collatzStepsBatch(range(1, 11))])
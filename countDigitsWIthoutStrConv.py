@@ -1,4 +1,24 @@
 import math
+from array import array
+from collections import Counter
+
+from powersOfTen import powerOfTen
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, array functions fall back to pure Python
+    np = None
+
+# Digit statistics work on base-10**4 limbs; per-limb digit histograms
+# (with leading zeros) are precomputed once on first use
+_LIMB_DIGITS = 4
+_LIMB_TABLE = []
+
+# Numbers with more bits than this use the limb engine (about 300 digits)
+_LIMB_THRESHOLD_BITS = 1000
+
+# floor(log10(2) * 2**128): fixed-point log10(2), slightly below the true value
+_LOG10_2_FIXED = 0x4d104d427de7fbcc47c4acd605be48bc
 
 
 def countDigits(n):
@@ -28,7 +48,9 @@ def countDigits(n):
 
 def countDigitsLog(n):
     """
-    Count digits using logarithm method (most efficient).
+    Count digits using logarithm method.
+    Float rounding makes it wrong near powers of ten for large n
+    (e.g. 10**15 - 1); use countDigitsExact for those.
     
     Args:
         n (int): The number to count digits for
@@ -116,12 +138,13 @@ def countDigitsBinarySearch(n):
     if n == 0:
         return 1
     
-    # Binary search between 1 and estimated upper bound
-    left, right = 1, 20  # 20 digits should cover most cases
+    # Binary search between 1 and an upper bound from the bit length
+    # (5/16 > log10(2), so n < 10 ** right always holds)
+    left, right = 1, (n.bit_length() * 5 >> 4) + 1
     
     while left < right:
         mid = (left + right) // 2
-        if n < 10 ** mid:
+        if n < powerOfTen(mid):
             right = mid
         else:
             left = mid + 1
@@ -129,6 +152,205 @@ def countDigitsBinarySearch(n):
     return left
 
 
+def countDigitsExact(n):
+    """
+    Count digits exactly using the bit length (fastest correct method).
+    
+    A number with b bits has either floor((b - 1) * log10(2)) + 1 digits or
+    one more. The floor is computed exactly with a 128-bit fixed-point
+    log10(2) (integer arithmetic, no floats), so a single comparison with a
+    cached power of ten picks the right answer, even for million-digit
+    numbers.
+    
+    Args:
+        n (int): The number to count digits for
+        
+    Returns:
+        int: Number of digits in the number
+    """
+    # Handle negative numbers
+    n = abs(n)
+    
+    # Special case: 0 has 1 digit
+    if n == 0:
+        return 1
+    
+    count = ((n.bit_length() - 1) * _LOG10_2_FIXED >> 128) + 1
+    if n >= powerOfTen(count):
+        count += 1
+    
+    return count
+
+
+def _limbTable():
+    if not _LIMB_TABLE:
+        for block in range(10 ** _LIMB_DIGITS):
+            row = [0] * 10
+            for _ in range(_LIMB_DIGITS):
+                row[block % 10] += 1
+                block //= 10
+            _LIMB_TABLE.append(row)
+    return _LIMB_TABLE
+
+
+def _splitLimbs(n, count, limbs):
+    # Append the `count` base-10**4 limbs of n, least significant first
+    if count <= 32:
+        for _ in range(count):
+            n, limb = divmod(n, 10 ** _LIMB_DIGITS)
+            limbs.append(limb)
+        return
+    half = count // 2
+    high, low = divmod(n, powerOfTen(_LIMB_DIGITS * half))
+    _splitLimbs(low, half, limbs)
+    _splitLimbs(high, count - half, limbs)
+
+
+def _limbFrequency(n):
+    # Digit histogram of n > 0 via divide-and-conquer limb splitting
+    count = -(-countDigitsExact(n) // _LIMB_DIGITS)
+    limbs = []
+    _splitLimbs(n, count, limbs)
+    
+    table = _limbTable()
+    frequency = [0] * 10
+    # Every limb except the most significant one has exactly 4 digits
+    for limb, times in Counter(limbs[:-1]).items():
+        row = table[limb]
+        for digit in range(10):
+            frequency[digit] += row[digit] * times
+    top = limbs[-1]
+    while top > 0:
+        frequency[top % 10] += 1
+        top //= 10
+    
+    return frequency
+
+
+class DigitProfile:
+    """
+    Compact result of digitProfile: every digit statistic of one number.
+    
+    Attributes:
+        count (int): Number of digits (countDigits)
+        frequency (tuple): Occurrences of digits 0-9 (digitFrequency)
+        sum (int): Sum of the digits (sumOfDigits)
+        product (int): Product of the digits (productOfDigits)
+        even (int): Number of even digits (countEvenOddDigits)
+        odd (int): Number of odd digits (countEvenOddDigits)
+    """
+    
+    __slots__ = ('count', 'frequency', 'sum', 'product', 'even', 'odd')
+    
+    def __init__(self, count, frequency, sum, product, even, odd):
+        self.count = count
+        self.frequency = frequency
+        self.sum = sum
+        self.product = product
+        self.even = even
+        self.odd = odd
+    
+    def __repr__(self):
+        return (f"DigitProfile(count={self.count}, frequency={self.frequency}, "
+                f"sum={self.sum}, product={self.product}, even={self.even}, odd={self.odd})")
+    
+    def __eq__(self, other):
+        if not isinstance(other, DigitProfile):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def countOf(self, digit):
+        """
+        Occurrences of one digit, like countSpecificDigit.
+        """
+        if not (0 <= digit <= 9):
+            raise ValueError("Digit must be between 0 and 9")
+        return self.frequency[digit]
+
+
+def digitProfile(n):
+    """
+    Compute every digit statistic of a number in a single traversal.
+    
+    The digits are walked once (or split into limbs for huge numbers, see
+    digitStatistics) to build the digit frequency; the count, sum, product
+    and even/odd counts all follow from it. Replaces separate calls to
+    countDigits, digitFrequency, sumOfDigits, productOfDigits,
+    countEvenOddDigits and countSpecificDigit, with identical results.
+    
+    Args:
+        n (int): The number to analyze
+        
+    Returns:
+        DigitProfile: All digit statistics of n
+    """
+    n = abs(n)
+    
+    if n == 0:
+        # One '0' digit, a digit sum of 0 and a product of 0
+        return DigitProfile(1, (1, 0, 0, 0, 0, 0, 0, 0, 0, 0), 0, 0, 1, 0)
+    
+    if n.bit_length() > _LIMB_THRESHOLD_BITS:
+        counts = _limbFrequency(n)
+    else:
+        counts = [0] * 10
+        while n > 0:
+            counts[n % 10] += 1
+            n = n // 10
+    
+    even = counts[0] + counts[2] + counts[4] + counts[6] + counts[8]
+    odd = counts[1] + counts[3] + counts[5] + counts[7] + counts[9]
+    if counts[0]:
+        product = 0
+    else:
+        product = math.prod(digit ** counts[digit] for digit in range(2, 10) if counts[digit])
+    digit_sum = (counts[1] + 2 * counts[2] + 3 * counts[3] + 4 * counts[4] + 5 * counts[5]
+                 + 6 * counts[6] + 7 * counts[7] + 8 * counts[8] + 9 * counts[9])
+    
+    return DigitProfile(even + odd, tuple(counts), digit_sum, product, even, odd)
+
+
+def digitProfileBatch(values):
+    """
+    Batch form of digitProfile.
+    
+    Args:
+        values (iterable): Integers (list, array.array, NumPy array, ...)
+        
+    Returns:
+        list: One DigitProfile per value, in input order
+    """
+    return [digitProfile(int(n)) for n in values]
+
+
+def digitStatistics(n):
+    """
+    Compute all digit statistics of a number at once, fast for huge values.
+    
+    Large numbers are split into base-10**4 limbs by divide and conquer
+    (cached powers of ten), limbs are tallied, and a precomputed per-limb
+    digit histogram turns the tally into the digit frequency. The other
+    statistics follow from the frequency. Results match digitFrequency,
+    sumOfDigits, productOfDigits, countEvenOddDigits and countDigits,
+    including their special cases for 0.
+    
+    Args:
+        n (int): The number to analyze
+        
+    Returns:
+        dict: count, frequency (dict digit -> count), sum, product, even, odd
+    """
+    profile = digitProfile(n)
+    return {
+        'count': profile.count,
+        'frequency': dict(enumerate(profile.frequency)),
+        'sum': profile.sum,
+        'product': profile.product,
+        'even': profile.even,
+        'odd': profile.odd,
+    }
+
+
 def countSpecificDigit(n, digit):
     """
     Count occurrences of a specific digit in a number.
@@ -149,6 +371,9 @@ def countSpecificDigit(n, digit):
     if n == 0:
         return 1 if digit == 0 else 0
     
+    if n.bit_length() > _LIMB_THRESHOLD_BITS:
+        return _limbFrequency(n)[digit]
+    
     count = 0
     while n > 0:
         if n % 10 == digit:
@@ -176,6 +401,9 @@ def digitFrequency(n):
         frequency[0] = 1
         return frequency
     
+    if n.bit_length() > _LIMB_THRESHOLD_BITS:
+        return dict(enumerate(_limbFrequency(n)))
+    
     while n > 0:
         digit = n % 10
         frequency[digit] += 1
@@ -202,6 +430,10 @@ def countEvenOddDigits(n):
     if n == 0:
         return (1, 0)
     
+    if n.bit_length() > _LIMB_THRESHOLD_BITS:
+        statistics = digitStatistics(n)
+        return (statistics['even'], statistics['odd'])
+    
     while n > 0:
         digit = n % 10
         if digit % 2 == 0:
@@ -226,6 +458,9 @@ def sumOfDigits(n):
     n = abs(n)
     digit_sum = 0
     
+    if n.bit_length() > _LIMB_THRESHOLD_BITS:
+        return digitStatistics(n)['sum']
+    
     while n > 0:
         digit_sum += n % 10
         n = n // 10
@@ -249,6 +484,9 @@ def productOfDigits(n):
     if n == 0:
         return 0
     
+    if n.bit_length() > _LIMB_THRESHOLD_BITS:
+        return digitStatistics(n)['product']
+    
     product = 1
     while n > 0:
         digit = n % 10
@@ -258,6 +496,146 @@ def productOfDigits(n):
     return product
 
 
+def _integerMagnitudes(values):
+    # Split an integer array into flat uint64 magnitudes and a sign mask.
+    # Signed input is read as int64 (uint64 holds abs(-2**63)), unsigned
+    # input as uint64, so no value is wrapped by a cast
+    values = np.asarray(values)
+    if not values.size:
+        values = values.astype(np.int64)
+    elif values.dtype.kind not in 'iu':
+        raise ValueError("Values must be integers")
+    values = values.ravel()
+    
+    if values.dtype.kind == 'u':
+        return values.astype(np.uint64), np.zeros(values.size, dtype=bool)
+    
+    values = values.astype(np.int64)
+    negative = values < 0
+    magnitudes = values.astype(np.uint64)
+    magnitudes[negative] = (~values[negative]).astype(np.uint64) + np.uint64(1)
+    return magnitudes, negative
+
+
+def _peelDigits(magnitudes):
+    # Yield (lanes, digits) rounds over a uint64 magnitude array: lanes are
+    # the indexes still holding digits, digits their last digit
+    lanes = np.flatnonzero(magnitudes)
+    remaining = magnitudes[lanes]
+    ten = np.uint64(10)
+    while lanes.size:
+        yield lanes, (remaining % ten).astype(np.int64)
+        remaining //= ten
+        # Retire lanes that ran out of digits
+        keep = remaining > 0
+        lanes, remaining = lanes[keep], remaining[keep]
+
+
+def countDigitsArray(values):
+    """
+    Vectorized countDigits over an integer array (0 has 1 digit).
+    
+    Args:
+        values (iterable): int64 or uint64 values (list, array.array or
+            NumPy array)
+        
+    Returns:
+        numpy.ndarray or array.array: int64 digit counts
+        
+    Raises:
+        ValueError: If the values are not integers
+    """
+    if np is None:
+        return array('q', [countDigits(n) for n in values])
+    
+    magnitudes, _ = _integerMagnitudes(values)
+    counts = np.zeros(magnitudes.size, dtype=np.int64)
+    for lanes, _ in _peelDigits(magnitudes):
+        counts[lanes] += 1
+    counts[counts == 0] = 1
+    return counts
+
+
+def sumOfDigitsArray(values):
+    """
+    Vectorized sumOfDigits over an integer array.
+    
+    Args:
+        values (iterable): int64 or uint64 values (list, array.array or
+            NumPy array)
+        
+    Returns:
+        numpy.ndarray or array.array: int64 digit sums
+        
+    Raises:
+        ValueError: If the values are not integers
+    """
+    if np is None:
+        return array('q', [sumOfDigits(n) for n in values])
+    
+    magnitudes, _ = _integerMagnitudes(values)
+    sums = np.zeros(magnitudes.size, dtype=np.int64)
+    for lanes, digits in _peelDigits(magnitudes):
+        sums[lanes] += digits
+    return sums
+
+
+def productOfDigitsArray(values):
+    """
+    Vectorized productOfDigits over an integer array (0 gives 0). At most
+    19 digits can be above 1 (a 20-digit uint64 starts with 1), and 9**19
+    fits in int64.
+    
+    Args:
+        values (iterable): int64 or uint64 values (list, array.array or
+            NumPy array)
+        
+    Returns:
+        numpy.ndarray or array.array: int64 digit products
+        
+    Raises:
+        ValueError: If the values are not integers
+    """
+    if np is None:
+        return array('q', [productOfDigits(n) for n in values])
+    
+    magnitudes, _ = _integerMagnitudes(values)
+    products = (magnitudes != 0).astype(np.int64)
+    for lanes, digits in _peelDigits(magnitudes):
+        products[lanes] *= digits
+    return products
+
+
+def countEvenOddDigitsArray(values):
+    """
+    Vectorized countEvenOddDigits over an integer array (0 counts as one even
+    digit).
+    
+    Args:
+        values (iterable): int64 or uint64 values (list, array.array or
+            NumPy array)
+        
+    Returns:
+        tuple: (even_counts, odd_counts) as int64 arrays
+        
+    Raises:
+        ValueError: If the values are not integers
+    """
+    if np is None:
+        pairs = [countEvenOddDigits(n) for n in values]
+        return array('q', [even for even, _ in pairs]), array('q', [odd for _, odd in pairs])
+    
+    magnitudes, _ = _integerMagnitudes(values)
+    evens = np.zeros(magnitudes.size, dtype=np.int64)
+    odds = np.zeros(magnitudes.size, dtype=np.int64)
+    for lanes, digits in _peelDigits(magnitudes):
+        odd = digits & 1
+        odds[lanes] += odd
+        evens[lanes] += 1 - odd
+    evens[(evens == 0) & (odds == 0)] = 1
+    return evens, odds
+
+
 # Performance comparison function
 def comparePerformance():
     """
@@ -269,6 +647,7 @@ def comparePerformance():
     test_numbers = [123, 12345, 1234567890, 10**15, 10**18]
     
     methods = [
+        ("Exact (bits)", countDigitsExact),
         ("Division Loop", countDigits),
         ("Logarithm", countDigitsLog),
         ("Powers of 10", countDigitsPowers),
@@ -279,7 +658,7 @@ def comparePerformance():
     print("=" * 60)
     
     for num in test_numbers:
-        print(f"\nTesting with number: {num} ({countDigitsLog(num)} digits)")
+        print(f"\nTesting with number: {num} ({countDigitsExact(num)} digits)")
         print("-" * 50)
         
         for name, func in methods:
@@ -307,12 +686,13 @@ if __name__ == "__main__":
         result3 = countDigitsRecursive(num)
         result4 = countDigitsPowers(num)
         result5 = countDigitsBinarySearch(num)
+        result6 = countDigitsExact(num)
         
-        all_match = all(r == result1 for r in [result2, result3, result4, result5])
+        all_match = all(r == result1 for r in [result2, result3, result4, result5, result6])
         status = "✓" if all_match else "✗"
         
         print(f"{num:15d} | Loop: {result1:2d} | Log: {result2:2d} | Rec: {result3:2d} | "
-              f"Pow: {result4:2d} | Bin: {result5:2d} | {status}")
+              f"Pow: {result4:2d} | Bin: {result5:2d} | Exact: {result6:2d} | {status}")
     
     print("\nTesting Additional Digit Functions:")
     print("=" * 50)
@@ -327,10 +707,28 @@ if __name__ == "__main__":
     print(f"Product of digits: {productOfDigits(test_num)}")
     print(f"Digit frequency: {digitFrequency(test_num)}")
     
+    big_num = 7 ** 20000
+    print(f"\nDigit statistics of 7**20000 ({countDigitsExact(big_num)} digits):")
+    statistics = digitStatistics(big_num)
+    print(f"Sum: {statistics['sum']}, even/odd: {statistics['even']}/{statistics['odd']}")
+    print(f"Frequency: {statistics['frequency']}")
+    
+    print(f"\nSingle-pass profile of {test_num}:")
+    print(digitProfile(test_num))
+    
+    array_input = [0, 7, -42, 123450, 999]
+    print(f"\nArray versions for {array_input}:")
+    print(f"Digit counts: {countDigitsArray(array_input).tolist()}")
+    print(f"Digit sums: {sumOfDigitsArray(array_input).tolist()}")
+    print(f"Digit products: {productOfDigitsArray(array_input).tolist()}")
+    even_counts, odd_counts = countEvenOddDigitsArray(array_input)
+    print(f"Even/odd digits: {list(zip(even_counts.tolist(), odd_counts.tolist()))}")
+    
     print("\nMethod Complexity Analysis:")
     print("-" * 40)
+    print("Exact (bits):   O(1) comparisons, O(1) space - FASTEST CORRECT")
     print("Division Loop:  O(log n) time, O(1) space")
-    print("Logarithm:      O(1) time, O(1) space - FASTEST")
+    print("Logarithm:      O(1) time, O(1) space - inexact for large n")
     print("Recursion:      O(log n) time, O(log n) space")
     print("Powers of 10:   O(log n) time, O(1) space")
     print("Binary Search:  O(log log n) time, O(1) space")
@@ -4,6 +4,31 @@
 # - 'Odd' if it's odd,
 # - 'Zero' if it’s 0.
 
+import math
+import warnings
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch functions fall back to pure Python
+    np = None
+
+# Category labels, indexed by the uint8 codes returned by digitClassifierBatch
+CATEGORY_LABELS = ('Zero', 'Even and divisible by 3', 'Even', 'Odd')
+
+# Maps a category code byte to its ASCII digit, for writing codes to text files
+_CODE_DIGITS = bytes.maketrans(bytes(range(10)), b'0123456789')
+
+_INT64_MAX = (1 << 63) - 1
+_INT64_MIN = -(1 << 63)
+
+# Largest residue/guard lookup table IntegerClassifier builds for batches
+_MAX_BATCH_TABLE = 1 << 24
+
+# Category code of every non-zero n, indexed by n % 6
+_RESIDUE_CODES = bytes([1, 3, 2, 3, 2, 3])
+
+
 def digitClassifier(n):
     """
     Classify an integer based on its properties.
@@ -30,6 +55,377 @@ def digitClassifier(n):
         return 'Odd'
 
 
+def digitClassifierBatch(values):
+    """
+    Classify many integers at once into compact category codes.
+    
+    Each value is mapped through a lookup table indexed by n % 6 (with zero
+    handled separately), which gives the same answer as digitClassifier,
+    negatives included. With NumPy available the whole batch is classified
+    with array operations (values beyond int64 are handled in Python).
+    
+    Args:
+        values (iterable): Integers (list, array.array or NumPy int array)
+        
+    Returns:
+        tuple: (codes, labels, counts) where codes is a uint8 array of
+        indexes into labels (CATEGORY_LABELS) and counts maps each label to
+        the number of values in that category
+    """
+    if np is not None:
+        values = np.asarray(values)
+        if not values.size:
+            values = values.astype(np.int64)
+        elif values.dtype == object:
+            # Integers too large for int64 take the pure Python path
+            values = values.ravel().tolist()
+        elif values.dtype.kind not in 'iu':
+            raise ValueError("Values must be integers")
+    
+    if np is not None and not isinstance(values, list):
+        codes = np.frombuffer(_RESIDUE_CODES, dtype=np.uint8)[values % 6]
+        codes[values == 0] = 0
+        totals = np.bincount(codes.ravel(), minlength=len(CATEGORY_LABELS)).tolist()
+    else:
+        table = _RESIDUE_CODES
+        codes = array('B', [table[n % 6] if n else 0 for n in values])
+        totals = [codes.count(code) for code in range(len(CATEGORY_LABELS))]
+    
+    counts = dict(zip(CATEGORY_LABELS, totals))
+    return codes, CATEGORY_LABELS, counts
+
+
+def _parseIntegers(block):
+    if np is not None and block:
+        # Count the tokens and check there is one per non-blank line, so a
+        # parse that stopped early, read a blank block as a zero or split a
+        # line into several values is caught
+        data = np.frombuffer(block, dtype=np.uint8)
+        space = data <= 32
+        tokens = int(np.count_nonzero(space[:-1] & ~space[1:])) + (not space[0])
+        # Usually every token is followed straight by a newline; otherwise
+        # compare the line indexes of the token starts
+        ends = np.flatnonzero(~space[:-1] & space[1:]) + 1
+        one_per_line = bool(np.all(data[ends] == 10))
+        if not one_per_line:
+            starts = np.flatnonzero(~space & np.concatenate(([True], space[:-1])))
+            line_ids = np.searchsorted(np.flatnonzero(data == 10), starts)
+            one_per_line = not np.any(line_ids[1:] == line_ids[:-1])
+        try:
+            with warnings.catch_warnings():
+                # Older NumPy only warns on unparsable data
+                warnings.simplefilter('error', DeprecationWarning)
+                values = np.fromstring(block, dtype=np.int64, sep=' ')
+        except (ValueError, DeprecationWarning):
+            values = None
+        
+        # fromstring saturates values outside int64 at the limits
+        if (values is not None and one_per_line and len(values) == tokens
+                and not np.any(values == _INT64_MAX)
+                and not np.any(values == _INT64_MIN)):
+            return values
+    
+    # Not bulk-parsable (or outside int64): parse line by line, which also
+    # rejects lines holding more than one value
+    return [int(line) for line in block.split(b'\n') if line.strip()]
+
+
+def classifyFile(path, output_path=None, block_size=1 << 22):
+    """
+    Classify a newline-delimited file of integers without loading it whole.
+    
+    The file is read in binary blocks of block_size bytes; the incomplete
+    last line of each block is carried over to the next one. Each block is
+    parsed in bulk and classified with digitClassifierBatch.
+    
+    Args:
+        path (str): Input file with one integer per line (blank lines are
+            skipped)
+        output_path (str, optional): If given, the category code of every
+            integer is written to this file, one digit per line
+        block_size (int): Bytes read per block
+        
+    Returns:
+        dict: Number of integers in each category, keyed by label
+        
+    Raises:
+        ValueError: If a line is not a single integer or block_size < 1
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer")
+    
+    counts = dict.fromkeys(CATEGORY_LABELS, 0)
+    output = open(output_path, 'wb') if output_path is not None else None
+    
+    def classifyBlock(block):
+        codes, _, block_counts = digitClassifierBatch(_parseIntegers(block))
+        for label, count in block_counts.items():
+            counts[label] += count
+        if output is not None and len(codes):
+            digits = bytes(codes).translate(_CODE_DIGITS)
+            lines = bytearray(2 * len(digits))
+            lines[0::2] = digits
+            lines[1::2] = b'\n' * len(digits)
+            output.write(lines)
+    
+    try:
+        with open(path, 'rb') as source:
+            remainder = b''
+            while True:
+                block = source.read(block_size)
+                if not block:
+                    break
+                cut = block.rfind(b'\n') + 1
+                if cut:
+                    classifyBlock(remainder + block[:cut])
+                    remainder = block[cut:]
+                else:
+                    remainder += block
+            if remainder.strip():
+                classifyBlock(remainder)
+    finally:
+        if output is not None:
+            output.close()
+    
+    return counts
+
+
+def divisibleBy(m):
+    """
+    Rule condition: n % m == 0.
+    """
+    return residueIn(m, 0)
+
+
+def residueIn(m, *residues):
+    """
+    Rule condition: n % m is one of residues (Python modulo, so negative n
+    behave like the % checks in digitClassifier).
+    """
+    if not isinstance(m, int) or m <= 0:
+        raise ValueError("Modulus must be a positive integer")
+    return ('mod', m, frozenset(r % m for r in residues))
+
+
+def inRange(low=None, high=None):
+    """
+    Rule condition: low <= n <= high (None means unbounded).
+    """
+    return ('range', low, high)
+
+
+def isZero():
+    """
+    Rule condition: n == 0.
+    """
+    return inRange(0, 0)
+
+
+def isNegative():
+    """
+    Rule condition: n < 0.
+    """
+    return inRange(None, -1)
+
+
+def isPositive():
+    """
+    Rule condition: n > 0.
+    """
+    return inRange(1, None)
+
+
+class IntegerClassifier:
+    """
+    Ordered classification rules compiled into a residue lookup table.
+    
+    Each rule is a (label, conditions) pair and the first rule whose
+    conditions all hold wins. Modulo conditions are folded into a table over
+    the LCM of all moduli, so most values are classified with one modulo and
+    one index. Range conditions (zero, sign, bounds) are kept as short
+    guard lists on the residues where they apply; batches fold the guard
+    results into the table index so they still need a single lookup.
+    
+    Args:
+        rules (list): (label, [conditions]) pairs in priority order; an
+            empty condition list always matches
+        default (str, optional): Label used when no rule matches
+        max_modulus (int): Largest allowed LCM of the moduli (table size)
+        
+    Raises:
+        ValueError: If a condition is invalid, there are more than 255
+            labels, or the LCM exceeds max_modulus
+    """
+    
+    def __init__(self, rules, default=None, max_modulus=1 << 20):
+        labels = []
+        compiled = []
+        modulus = 1
+        for label, conditions in rules:
+            if label not in labels:
+                labels.append(label)
+            moduli = []
+            low = high = None
+            for condition in conditions:
+                if condition[0] == 'mod':
+                    moduli.append(condition[1:])
+                    modulus = math.lcm(modulus, condition[1])
+                elif condition[0] == 'range':
+                    # Intersect all range conditions of the rule
+                    if condition[1] is not None:
+                        low = condition[1] if low is None else max(low, condition[1])
+                    if condition[2] is not None:
+                        high = condition[2] if high is None else min(high, condition[2])
+                else:
+                    raise ValueError(f"Unknown condition: {condition!r}")
+            guard = None if low is None and high is None else (low, high)
+            compiled.append((moduli, guard, labels.index(label)))
+        if default is not None and default not in labels:
+            labels.append(default)
+        if len(labels) > 255:
+            raise ValueError("At most 255 labels are supported")
+        if modulus > max_modulus:
+            raise ValueError(f"LCM of the moduli ({modulus}) exceeds max_modulus")
+        
+        self.labels = tuple(labels)
+        self.modulus = modulus
+        self._arrays = None
+        default_code = None if default is None else labels.index(default)
+        
+        # Table entry per residue: a code when the first matching rule has no
+        # guard, otherwise a tuple of (guard, code) candidates to try in order
+        self._table = []
+        for r in range(modulus):
+            candidates = []
+            for moduli, guard, code in compiled:
+                if all(r % m in residues for m, residues in moduli):
+                    candidates.append((guard, code))
+                    if guard is None:
+                        break
+            else:
+                candidates.append((None, default_code))
+            if candidates[0][0] is None:
+                self._table.append(candidates[0][1])
+            else:
+                self._table.append(tuple(candidates))
+    
+    def _code(self, n):
+        entry = self._table[n % self.modulus]
+        if type(entry) is tuple:
+            for guard, code in entry:
+                if guard is None or ((guard[0] is None or n >= guard[0])
+                                     and (guard[1] is None or n <= guard[1])):
+                    entry = code
+                    break
+        if entry is None:
+            raise ValueError(f"No rule matches {n}")
+        return entry
+    
+    def classify(self, n):
+        """
+        Classify a single integer.
+        
+        Args:
+            n (int): The integer to classify
+            
+        Returns:
+            str: Label of the first matching rule
+            
+        Raises:
+            ValueError: If no rule matches and there is no default
+        """
+        return self.labels[self._code(n)]
+    
+    def classifyBatch(self, values):
+        """
+        Classify many integers at once, like digitClassifierBatch.
+        
+        Args:
+            values (iterable): Integers (list, array.array or NumPy int array)
+            
+        Returns:
+            tuple: (codes, labels, counts) with uint8 codes indexing labels
+            
+        Raises:
+            ValueError: If no rule matches some value and there is no default
+        """
+        if np is not None:
+            values = np.asarray(values)
+            if not values.size:
+                values = values.astype(np.int64)
+            elif values.dtype == object:
+                values = values.ravel().tolist()
+            elif values.dtype.kind not in 'iu':
+                raise ValueError("Values must be integers")
+            elif values.dtype.kind == 'u' and values.max() > _INT64_MAX:
+                # uint64 values beyond int64 would wrap in the cast below
+                values = values.ravel().tolist()
+        
+        if np is not None and not isinstance(values, list):
+            codes = self._batchCodes(values.astype(np.int64)).reshape(values.shape)
+            totals = np.bincount(codes.ravel(), minlength=len(self.labels)).tolist()
+        else:
+            codes = array('B', [self._code(n) for n in values])
+            totals = [codes.count(code) for code in range(len(self.labels))]
+        
+        counts = dict(zip(self.labels, totals))
+        return codes, self.labels, counts
+    
+    def _buildArrays(self):
+        # Batch table indexed by residue * 2^G + guard bits, where bit i
+        # tells whether a value lies inside the i-th distinct guard range
+        guards = list(dict.fromkeys(guard for entry in self._table if type(entry) is tuple
+                                    for guard, _ in entry if guard is not None))
+        width = 1 << len(guards)
+        if self.modulus * width > _MAX_BATCH_TABLE:
+            self._arrays = False
+            return
+        
+        table = np.full(self.modulus * width, 255, dtype=np.uint8)
+        for r, entry in enumerate(self._table):
+            for bits in range(width):
+                code = entry
+                if type(entry) is tuple:
+                    for guard, candidate in entry:
+                        if guard is None or bits >> guards.index(guard) & 1:
+                            code = candidate
+                            break
+                table[r * width + bits] = 255 if code is None else code
+        self._arrays = (guards, table)
+    
+    def _batchCodes(self, values):
+        if self._arrays is None:
+            self._buildArrays()
+        if self._arrays is False:
+            return np.array([self._code(int(n)) for n in values.ravel()], dtype=np.uint8)
+        guards, table = self._arrays
+        
+        key = values % self.modulus << len(guards)
+        for bit, (low, high) in enumerate(guards):
+            inside = np.ones(values.shape, dtype=bool)
+            # Bounds outside int64 are compared as Python ints against the extremes
+            if low is not None:
+                inside &= values >= low if _INT64_MIN <= low <= _INT64_MAX else low < _INT64_MIN
+            if high is not None:
+                inside &= values <= high if _INT64_MIN <= high <= _INT64_MAX else high > _INT64_MAX
+            key |= inside.astype(np.int64) << bit
+        
+        result = table[key]
+        missing = np.flatnonzero(result == 255)
+        if missing.size:
+            raise ValueError(f"No rule matches {values.ravel()[missing[0]]}")
+        return result
+
+
+# The digitClassifier rules expressed declaratively
+DIGIT_CLASSIFIER_RULES = [
+    ('Zero', [isZero()]),
+    ('Even and divisible by 3', [divisibleBy(2), divisibleBy(3)]),
+    ('Even', [divisibleBy(2)]),
+    ('Odd', []),
+]
+
+
 # Test the function with various inputs
 if __name__ == "__main__":
     test_cases = [0, 1, 2, 3, 4, 5, 6, 9, 12, 15, 18, -6, -9, -12]
@@ -38,4 +434,34 @@ if __name__ == "__main__":
     print("-" * 40)
     for num in test_cases:
         result = digitClassifier(num)
-        print(f"digitClassifier({num:3d}) = '{result}'")
\ No newline at end of file
+        print(f"digitClassifier({num:3d}) = '{result}'")
+    
+    print("\nBatch classification:")
+    codes, labels, counts = digitClassifierBatch(test_cases)
+    print(f"Codes:  {codes.tolist()}")
+    print(f"Labels: {[labels[code] for code in codes]}")
+    print(f"Counts: {counts}")
+    
+    print("\nRule engine (divisibility by 3/5/7 with sign):")
+    rules = [
+        ('Zero', [isZero()]),
+        ('Negative', [isNegative()]),
+        ('FizzBuzz', [divisibleBy(15)]),
+        ('Fizz', [divisibleBy(3)]),
+        ('Buzz', [divisibleBy(5)]),
+        ('Bazz', [divisibleBy(7)]),
+    ]
+    classifier = IntegerClassifier(rules, default='Other')
+    for num in [0, -5, 15, 9, 10, 14, 11]:
+        print(f"  {num:3d} -> {classifier.classify(num)}")
+    matches = IntegerClassifier(DIGIT_CLASSIFIER_RULES).classify
+    print(f"Matches digitClassifier: {all(matches(n) == digitClassifier(n) for n in test_cases)}")
+    
+    print("\nStreaming file classification:")
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, 'numbers.txt')
+        with open(input_path, 'w') as numbers_file:
+            numbers_file.write('\n'.join(map(str, range(-50, 51))))
+        print(f"Counts: {classifyFile(input_path)}")
\ No newline at end of file
@@ -1,7 +1,311 @@
+import math
+import os
+from array import array
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, buffer functions fall back to pure Python
+    np = None
+
+# Values written to typed buffers must stay inside int64
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _checkInt64(low, high):
+    if low < _INT64_MIN or high > _INT64_MAX:
+        raise OverflowError("Value does not fit in int64")
+
+
+class Pipeline:
+    """
+    Declarative filter/map pipeline fused into a single pass.
+    
+    Stages are added with keepEvens, keepDivisibleBy, multiplyBy and add;
+    each call returns a new Pipeline, so predefined pipelines can be shared.
+    All maps are affine, so the stages collapse into filter conditions of
+    the form (a * x + b) % m == 0 on the input value plus one output
+    expression a * x + b. On integers the conditions combine into a single
+    residue test x % M == R, so lists take one comprehension; typed
+    buffers take a few NumPy mask/multiply operations.
+    
+    Args:
+        stages (iterable): Stage tuples, normally built with the methods
+    """
+    
+    def __init__(self, stages=()):
+        self.stages = tuple(stages)
+        self._fused = None
+    
+    def __repr__(self):
+        return f"Pipeline({list(self.stages)!r})"
+    
+    def _then(self, stage):
+        return Pipeline(self.stages + (stage,))
+    
+    @staticmethod
+    def _checkInt(value, name):
+        if not isinstance(value, int):
+            raise ValueError(f"{name} must be an integer")
+    
+    def keepEvens(self):
+        """
+        Keep only even values.
+        """
+        return self.keepDivisibleBy(2)
+    
+    def keepDivisibleBy(self, m):
+        """
+        Keep only values divisible by m.
+        """
+        self._checkInt(m, "Divisor")
+        if m == 0:
+            raise ValueError("Divisor must not be zero")
+        return self._then(('keep', m))
+    
+    def multiplyBy(self, k):
+        """
+        Multiply every value by k.
+        """
+        self._checkInt(k, "Factor")
+        return self._then(('multiply', k))
+    
+    def add(self, c):
+        """
+        Add c to every value.
+        """
+        self._checkInt(c, "Offset")
+        return self._then(('add', c))
+    
+    def _normalize(self):
+        # Express every stage relative to the input value x: the current
+        # value is a * x + b, and each filter becomes (a, b, m)
+        a, b = 1, 0
+        conditions = []
+        for kind, value in self.stages:
+            if kind == 'keep':
+                conditions.append((a, b, value))
+            elif kind == 'multiply':
+                a, b = a * value, b * value
+            else:
+                b += value
+        return conditions, (a, b)
+    
+    @staticmethod
+    def _residue(conditions):
+        # Collapse the filters (a * x + b) % m == 0 into one test
+        # x % modulus == residue; residue is None when nothing can pass
+        modulus, residue = 1, 0
+        for a, b, m in conditions:
+            m = abs(m)
+            g = math.gcd(a, m)
+            if b % g:
+                return 1, None
+            m //= g
+            r = (-b // g) * pow(a // g, -1, m) % m
+            
+            # Chinese remainder step: merge x = residue (mod modulus) with
+            # x = r (mod m)
+            g = math.gcd(modulus, m)
+            if (r - residue) % g:
+                return 1, None
+            step = (r - residue) // g * pow(modulus // g, -1, m // g) % (m // g)
+            residue += modulus * step
+            modulus = modulus // g * m
+            residue %= modulus
+        return modulus, residue
+    
+    def _fuse(self):
+        # Pick the comprehension that does no more work than the pipeline
+        # needs, so a fused pipeline is as fast as the hand-written loop
+        if self._fused is None:
+            conditions, (a, b) = self._normalize()
+            modulus, residue = self._residue(conditions)
+            
+            if residue is None:
+                def fused(numbers):
+                    return []
+            elif modulus == 1:
+                if (a, b) == (1, 0):
+                    def fused(numbers):
+                        return list(numbers)
+                elif b == 0:
+                    def fused(numbers):
+                        return [x * a for x in numbers]
+                elif a == 1:
+                    def fused(numbers):
+                        return [x + b for x in numbers]
+                else:
+                    def fused(numbers):
+                        return [x * a + b for x in numbers]
+            elif (a, b) == (1, 0):
+                def fused(numbers):
+                    return [x for x in numbers if x % modulus == residue]
+            elif b == 0:
+                def fused(numbers):
+                    return [x * a for x in numbers if x % modulus == residue]
+            elif a == 1:
+                def fused(numbers):
+                    return [x + b for x in numbers if x % modulus == residue]
+            else:
+                def fused(numbers):
+                    return [x * a + b for x in numbers if x % modulus == residue]
+            self._fused = fused
+        return self._fused
+    
+    def __call__(self, numbers):
+        """
+        Run the pipeline over an iterable in one pass.
+        
+        Args:
+            numbers (iterable): Values to process
+            
+        Returns:
+            list: Output values in input order
+        """
+        return self._fuse()(numbers)
+    
+    def _arrayValues(self, numbers, out=None):
+        # NumPy path: returns the int64 result without per-element Python
+        # calls, written into the int64 array out when one is given
+        values = np.asarray(numbers)
+        if values.dtype.kind not in 'iu':
+            if values.size:
+                raise ValueError("Buffer must contain integers")
+            values = values.astype(np.int64)
+        values = values.ravel()
+        if values.size:
+            _checkInt64(int(values.min()), int(values.max()))
+        values = values.astype(np.int64, copy=False)
+        
+        conditions, output = self._normalize()
+        for a, b, m in conditions:
+            if not values.size:
+                break
+            if (a, b, m) == (1, 0, 2):
+                values = values[(values & 1) == 0]
+                continue
+            low, high = int(values.min()), int(values.max())
+            _checkInt64(min(a * low + b, a * high + b), max(a * low + b, a * high + b))
+            values = values[(values * a + b) % m == 0]
+        
+        a, b = output
+        if values.size and (a, b) != (1, 0):
+            low, high = int(values.min()), int(values.max())
+            _checkInt64(min(a * low + b, a * high + b), max(a * low + b, a * high + b))
+        
+        if out is None:
+            return values * a + b if (a, b) != (1, 0) else values
+        
+        if values.size > len(out):
+            raise ValueError("out is too small for the result")
+        target = out[:values.size]
+        if (a, b) == (1, 0):
+            target[...] = values
+        else:
+            np.multiply(values, a, out=target)
+            if b:
+                np.add(target, b, out=target)
+        return target
+    
+    def array(self, numbers):
+        """
+        Run the pipeline over a typed integer buffer.
+        
+        Args:
+            numbers (buffer): array.array, memoryview or NumPy integer buffer
+            
+        Returns:
+            numpy.ndarray or array.array: int64 buffer of output values
+            
+        Raises:
+            OverflowError: If an intermediate or output value does not fit
+                in int64
+        """
+        if np is not None:
+            result = self._arrayValues(numbers)
+            # A pipeline without stages may hand back a view of the input
+            if np.may_share_memory(result, np.asarray(numbers)):
+                result = result.copy()
+            return result
+        
+        try:
+            return array('q', self(memoryview(numbers)))
+        except OverflowError:
+            raise OverflowError("Value does not fit in int64") from None
+    
+    def into(self, numbers, out):
+        """
+        Run the pipeline and write the output into a caller-supplied buffer.
+        
+        Args:
+            numbers (buffer): Integers to process
+            out (buffer): Writable int64 buffer (array('q'), NumPy int64
+                array, ...) large enough for the result
+            
+        Returns:
+            int: Number of values written to the start of out
+            
+        Raises:
+            OverflowError: If a value does not fit in int64
+            ValueError: If out is not a writable int64 buffer or is too small
+        """
+        target = memoryview(out)
+        if target.readonly or target.itemsize != 8 or target.format not in ('q', 'l', '<q', '=q'):
+            raise ValueError("out must be a writable int64 buffer")
+        target = target.cast('B').cast('q')
+        
+        if np is not None:
+            return int(self._arrayValues(numbers, np.asarray(target)).size)
+        
+        result = self.array(numbers)
+        if len(result) > len(target):
+            raise ValueError("out is too small for the result")
+        target[:len(result)] = memoryview(result)
+        return len(result)
+    
+    def stream(self, numbers, batch_size=4096):
+        """
+        Run the pipeline over an iterable in batches.
+        
+        Args:
+            numbers (iterable): Values to process (may be a generator)
+            batch_size (int): Number of input items consumed per batch
+            
+        Returns:
+            generator: Non-empty lists of output values, in input order
+            
+        Raises:
+            ValueError: If batch_size is not a positive integer
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        
+        return self._batches(numbers, batch_size)
+    
+    def _batches(self, numbers, batch_size):
+        fused = self._fuse()
+        iterator = iter(numbers)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            result = fused(batch)
+            if result:
+                yield result
+
+
+# processEvenNumbers as a pipeline: keep even numbers, then double them
+EVEN_DOUBLER = Pipeline().keepEvens().multiplyBy(2)
+
+
 def processEvenNumbers(numbers):
     """
     Takes a list of integers and returns a new list with even numbers doubled
-    and odd numbers removed.
+    and odd numbers removed. Runs the predefined EVEN_DOUBLER pipeline.
     
     Args:
         numbers (list): List of integers to process
@@ -9,11 +313,7 @@ def processEvenNumbers(numbers):
     Returns:
         list: New list containing only doubled even numbers
     """
-    result = []
-    for num in numbers:
-        if num % 2 == 0:  # Check if number is even
-            result.append(num * 2)  # Double the even number and add to result
-    return result
+    return EVEN_DOUBLER(numbers)
 
 
 def processEvenNumbersListComp(numbers):
@@ -44,6 +344,198 @@ def processEvenNumbersFilter(numbers):
     return list(map(lambda x: x * 2, even_numbers))
 
 
+def processEvenNumbersArray(numbers):
+    """
+    Typed-buffer version of processEvenNumbers.
+    
+    Accepts any integer buffer (array.array, memoryview, NumPy array) and
+    returns the doubled even numbers as a compact int64 buffer instead of a
+    list of boxed ints. With NumPy available the work is done with array
+    operations.
+    
+    Args:
+        numbers (buffer): Integers to process
+        
+    Returns:
+        numpy.ndarray or array.array: int64 buffer of doubled even numbers
+        
+    Raises:
+        OverflowError: If a doubled value does not fit in int64
+    """
+    return EVEN_DOUBLER.array(numbers)
+
+
+def processEvenNumbersInto(numbers, out):
+    """
+    Write the doubled even numbers into a caller-supplied int64 buffer.
+    
+    Args:
+        numbers (buffer): Integers to process
+        out (buffer): Writable int64 buffer (array('q'), NumPy int64 array,
+            ...) large enough for the result
+        
+    Returns:
+        int: Number of values written to the start of out
+        
+    Raises:
+        OverflowError: If a doubled value does not fit in int64
+        ValueError: If out is not a writable int64 buffer or is too small
+    """
+    return EVEN_DOUBLER.into(numbers, out)
+
+
+def processEvenNumbersStream(numbers, batch_size=4096):
+    """
+    Streaming version of processEvenNumbers for unbounded inputs.
+    
+    Consumes any iterable batch_size items at a time and yields the doubled
+    even numbers of each batch as soon as it is processed, so peak memory is
+    proportional to batch_size and consumers can start before the input ends.
+    Batches without even numbers produce no output.
+    
+    Args:
+        numbers (iterable): Integers to process (may be a generator)
+        batch_size (int): Number of input items consumed per batch
+        
+    Returns:
+        generator: Lists of doubled even numbers, in input order
+        
+    Raises:
+        ValueError: If batch_size is not a positive integer
+    """
+    return EVEN_DOUBLER.stream(numbers, batch_size)
+
+
+def _sharedInt64(memory, length):
+    # int64 view of a shared memory block (which may be rounded up in size)
+    return memory.buf[:8 * length].cast('q')
+
+
+def _scanSlice(task):
+    # Phase 1: count the evens of one slice and report their extremes
+    name, length, start, stop = task
+    memory = SharedMemory(name=name)
+    try:
+        if np is not None:
+            values = np.ndarray(length, dtype=np.int64, buffer=memory.buf)[start:stop]
+            evens = values[(values & 1) == 0]
+            if not evens.size:
+                return 0, 0, 0
+            return int(evens.size), int(evens.min()), int(evens.max())
+        view = _sharedInt64(memory, length)
+        evens = [num for num in view[start:stop] if num % 2 == 0]
+        view.release()
+        if not evens:
+            return 0, 0, 0
+        return len(evens), min(evens), max(evens)
+    finally:
+        memory.close()
+
+
+def _writeSlice(task):
+    # Phase 2: write the doubled evens of one slice at its output offset
+    name, length, out_name, out_length, start, stop, offset = task
+    memory = SharedMemory(name=name)
+    output = SharedMemory(name=out_name)
+    try:
+        if np is not None:
+            values = np.ndarray(length, dtype=np.int64, buffer=memory.buf)[start:stop]
+            evens = values[(values & 1) == 0]
+            target = np.ndarray(out_length, dtype=np.int64, buffer=output.buf)
+            target[offset:offset + evens.size] = evens * 2
+            del values, evens, target
+        else:
+            view = _sharedInt64(memory, length)
+            target = _sharedInt64(output, out_length)
+            result = array('q', [num * 2 for num in view[start:stop] if num % 2 == 0])
+            target[offset:offset + len(result)] = memoryview(result)
+            view.release()
+            target.release()
+    finally:
+        memory.close()
+        output.close()
+
+
+def processEvenNumbersParallel(numbers, workers=None, slices_per_worker=4):
+    """
+    Multi-process processEvenNumbers for very large inputs.
+    
+    The input is copied once into shared memory. Workers first count the
+    even numbers of disjoint slices; a prefix sum of those counts gives each
+    slice its output offset, and workers then write their doubled evens
+    straight into a shared output buffer in the original order. No element
+    lists are pickled between processes.
+    
+    Args:
+        numbers (buffer or iterable): Integers that fit in int64
+        workers (int, optional): Number of processes (default: CPU count)
+        slices_per_worker (int): Slices per worker, for load balancing
+        
+    Returns:
+        numpy.ndarray or array.array: int64 buffer of doubled even numbers
+        
+    Raises:
+        OverflowError: If a value or doubled value does not fit in int64
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if np is not None:
+        source = np.asarray(numbers)
+        if source.size and source.dtype.kind not in 'iu':
+            raise ValueError("Buffer must contain integers")
+        if source.size:
+            _checkInt64(int(source.min()), int(source.max()))
+        source = source.astype(np.int64, copy=False).ravel()
+    else:
+        source = numbers if isinstance(numbers, array) and numbers.typecode == 'q' else array('q', numbers)
+    length = len(source)
+    if workers < 2 or length < 2 * workers:
+        return EVEN_DOUBLER.array(source)
+    
+    slice_count = min(length, workers * slices_per_worker)
+    bounds = [length * i // slice_count for i in range(slice_count + 1)]
+    memory = SharedMemory(create=True, size=8 * length)
+    output = None
+    try:
+        view = _sharedInt64(memory, length)
+        view[:] = memoryview(source).cast('B').cast('q')
+        view.release()
+        
+        with Pool(workers) as pool:
+            scans = pool.map(_scanSlice, [(memory.name, length, bounds[i], bounds[i + 1])
+                                          for i in range(slice_count)])
+            found = [scan for scan in scans if scan[0]]
+            if found:
+                _checkInt64(2 * min(scan[1] for scan in found), 2 * max(scan[2] for scan in found))
+            
+            # Prefix sum of the even counts gives every slice its output offset
+            offsets = [0]
+            for count, _, _ in scans:
+                offsets.append(offsets[-1] + count)
+            total = offsets[-1]
+            if not total:
+                return EVEN_DOUBLER.array(source[:0])
+            
+            output = SharedMemory(create=True, size=8 * total)
+            pool.map(_writeSlice, [(memory.name, length, output.name, total,
+                                    bounds[i], bounds[i + 1], offsets[i])
+                                   for i in range(slice_count) if scans[i][0]])
+        
+        view = _sharedInt64(output, total)
+        if np is not None:
+            result = np.array(view, dtype=np.int64)
+        else:
+            result = array('q', view.tobytes())
+        view.release()
+        return result
+    finally:
+        memory.close()
+        memory.unlink()
+        if output is not None:
+            output.close()
+            output.unlink()
+
+
 # Test the functions
 if __name__ == "__main__":
     test_cases = [
@@ -66,8 +558,27 @@ if __name__ == "__main__":
         
         print(f"Test {i}:")
         print(f"  Input:           {test_list}")
-        print(f"  Result (loop):   {result1}")
+        print(f"  Result (fused):  {result1}")
         print(f"  Result (comp):   {result2}")
         print(f"  Result (filter): {result3}")
         print(f"  All match:       {result1 == result2 == result3}")
-        print()
\ No newline at end of file
+        print()
+    
+    print("Typed buffer variants:")
+    buffer = array('q', [0, -2, -3, -4, 7, 8])
+    print(f"  Array result:    {processEvenNumbersArray(buffer).tolist()}")
+    out = array('q', bytes(8 * len(buffer)))
+    count = processEvenNumbersInto(buffer, out)
+    print(f"  Into buffer:     {out[:count].tolist()}")
+    
+    print("\nStreaming batches (batch_size=4) from a generator:")
+    for batch in processEvenNumbersStream((num for num in range(1, 13)), batch_size=4):
+        print(f"  {batch}")
+    
+    print("\nFused pipeline (keep evens, triple, add 1, keep multiples of 5):")
+    pipeline = Pipeline().keepEvens().multiplyBy(3).add(1).keepDivisibleBy(5)
+    print(f"  {pipeline(range(20))}")
+    
+    print("\nShared-memory parallel version:")
+    parallel = processEvenNumbersParallel(array('q', range(-10, 11)), workers=2)
+    print(f"  {parallel.tolist()}")
\ No newline at end of file
@@ -1,3 +1,8 @@
+from countDigitsWIthoutStrConv import countDigitsExact
+from powersOfTen import powerOfTen
+from reverseNumber import reverseNumberFast
+
+
 def isPalindrome(n):
     """
     Check if a number is a palindrome without converting to string.
@@ -82,13 +87,9 @@ def isPalindromeRecursive(n, power=None):
     if n < 10:
         return True
     
-    # Calculate the power for the most significant digit
+    # Look up the power for the most significant digit
     if power is None:
-        temp = n
-        power = 1
-        while temp >= 10:
-            power *= 10
-            temp //= 10
+        power = powerOfTen(countDigitsExact(n) - 1)
     
     # Get first and last digits
     first_digit = n // power
@@ -169,6 +170,67 @@ def isPalindromeTwoPointers(n):
     return True
 
 
+def _mirror(prefix, length):
+    """
+    Build the palindrome with `length` digits whose leading half is prefix.
+    """
+    half = (length + 1) // 2
+    # For odd lengths the middle digit is not repeated
+    tail = prefix // 10 if length % 2 else prefix
+    if tail.bit_length() > 128:
+        reversed_tail = reverseNumberFast(tail)
+    else:
+        reversed_tail = 0
+        while tail > 0:
+            reversed_tail = reversed_tail * 10 + tail % 10
+            tail //= 10
+    return prefix * powerOfTen(length - half) + reversed_tail
+
+
+def _palindromesBetween(start, end):
+    # Single digits (including 0) are palindromes
+    for num in range(start, min(end, 9) + 1):
+        yield num
+    
+    length = max(2, countDigitsExact(start))
+    while powerOfTen(length - 1) <= end:
+        half = (length + 1) // 2
+        first_prefix = powerOfTen(half - 1)
+        if start >= powerOfTen(length - 1):
+            # start has this length: begin at its own leading half
+            first_prefix = start // powerOfTen(length - half)
+        
+        for prefix in range(first_prefix, powerOfTen(half)):
+            palindrome = _mirror(prefix, length)
+            if palindrome > end:
+                return
+            if palindrome >= start:
+                yield palindrome
+        length += 1
+
+
+def iterPalindromes(start, end):
+    """
+    Lazily generate the palindromes in a range, in ascending order.
+    
+    Palindromes are built by mirroring half-length prefixes instead of
+    testing every integer, so the work is proportional to the number of
+    palindromes produced rather than to the width of the range. Negative
+    numbers are never palindromes, like in isPalindrome.
+    
+    Args:
+        start (int): Start of range (inclusive)
+        end (int): End of range (inclusive)
+        
+    Returns:
+        generator: Palindromic numbers in [start, end], ascending
+    """
+    start = max(start, 0)
+    if end < start:
+        return iter(())
+    return _palindromesBetween(start, end)
+
+
 def findPalindromes(start, end):
     """
     Find all palindromes in a given range.
@@ -180,16 +242,14 @@ def findPalindromes(start, end):
     Returns:
         list: All palindromic numbers in the range
     """
-    palindromes = []
-    for num in range(start, end + 1):
-        if isPalindrome(num):
-            palindromes.append(num)
-    return palindromes
+    return list(iterPalindromes(start, end))
 
 
 def nextPalindrome(n):
     """
     Find the next palindrome after a given number.
+    Built directly from the leading half of n + 1 instead of testing
+    successive numbers, so it takes time linear in the digit count.
     
     Args:
         n (int): Starting number
@@ -198,9 +258,149 @@ def nextPalindrome(n):
         int: Next palindromic number
     """
     n += 1
-    while not isPalindrome(n):
-        n += 1
-    return n
+    
+    # Negative numbers are not palindromes, so the next one is 0
+    if n <= 0:
+        return 0
+    
+    length = countDigitsExact(n)
+    half = (length + 1) // 2
+    prefix = n // powerOfTen(length - half)
+    
+    # Mirroring the left half gives the closest candidate of this length
+    candidate = _mirror(prefix, length)
+    if candidate >= n:
+        return candidate
+    
+    # Otherwise increment the left half (carrying into the middle digit)
+    prefix += 1
+    if prefix == powerOfTen(half):
+        # All nines: the next palindrome is 10...01 with one more digit
+        return powerOfTen(length) + 1
+    return _mirror(prefix, length)
+
+
+def prevPalindrome(n):
+    """
+    Find the largest palindrome below a given number (mirror image of
+    nextPalindrome).
+    
+    Args:
+        n (int): Starting number
+        
+    Returns:
+        int: Previous palindromic number
+        
+    Raises:
+        ValueError: If n <= 0 (negative numbers are not palindromes)
+    """
+    n -= 1
+    
+    if n < 0:
+        raise ValueError("There is no palindrome below 0")
+    
+    if n < 10:
+        return n
+    
+    length = countDigitsExact(n)
+    half = (length + 1) // 2
+    prefix = n // powerOfTen(length - half)
+    
+    candidate = _mirror(prefix, length)
+    if candidate <= n:
+        return candidate
+    
+    # Decrement the left half (borrowing from the middle digit)
+    prefix -= 1
+    if prefix < powerOfTen(half - 1):
+        # n was 10...0 or 10...01: the previous palindrome is all nines
+        return powerOfTen(length - 1) - 1
+    return _mirror(prefix, length)
+
+
+def _countWithDigits(length):
+    """
+    Number of palindromes in [0, 10**length), i.e. with at most `length`
+    digits (0 included).
+    """
+    if length <= 0:
+        return 0
+    # 10 single digits, then 9 * 10**(ceil(L / 2) - 1) for each length L >= 2
+    if length % 2:
+        return 11 * powerOfTen(length // 2) - 1
+    return 2 * powerOfTen(length // 2) - 1
+
+
+def _countUpTo(x):
+    # Number of palindromes in [0, x]
+    if x < 0:
+        return 0
+    if x < 10:
+        return x + 1
+    
+    length = countDigitsExact(x)
+    half = (length + 1) // 2
+    prefix = x // powerOfTen(length - half)
+    
+    # Every smaller leading half of this length gives a palindrome <= x
+    same_length = prefix - powerOfTen(half - 1)
+    if _mirror(prefix, length) <= x:
+        same_length += 1
+    return _countWithDigits(length - 1) + same_length
+
+
+def countPalindromes(start, end):
+    """
+    Count the palindromes in a range without enumerating them.
+    
+    Uses the closed-form count of palindromes per digit length plus the
+    position of the range bounds' leading halves, so it runs in time
+    linear in the digit count. Negative numbers are never palindromes.
+    
+    Args:
+        start (int): Start of range (inclusive)
+        end (int): End of range (inclusive)
+        
+    Returns:
+        int: Number of palindromic numbers in the range
+    """
+    if end < start:
+        return 0
+    return _countUpTo(end) - _countUpTo(start - 1)
+
+
+def kthPalindrome(k):
+    """
+    Find the k-th palindrome in ascending order (1-based, the first one
+    is 0), consistent with countPalindromes: there are exactly k
+    palindromes in [0, kthPalindrome(k)].
+    
+    Args:
+        k (int): Position of the palindrome (k >= 1)
+        
+    Returns:
+        int: The k-th palindromic number
+        
+    Raises:
+        ValueError: If k < 1
+    """
+    if k < 1:
+        raise ValueError("k must be a positive integer")
+    
+    if k <= 10:
+        return k - 1
+    
+    # Palindromes with up to L digits number about 10**(L / 2), so k's
+    # digit count gives the length up to a small correction
+    length = max(2, 2 * countDigitsExact(k) - 2)
+    while _countWithDigits(length - 1) >= k:
+        length -= 1
+    while _countWithDigits(length) < k:
+        length += 1
+    
+    offset = k - _countWithDigits(length - 1) - 1
+    half = (length + 1) // 2
+    return _mirror(powerOfTen(half - 1) + offset, length)
 
 
 # Test the functions
@@ -234,12 +434,30 @@ if __name__ == "__main__":
     palindromes_100_200 = findPalindromes(100, 200)
     print(f"Palindromes: {palindromes_100_200}")
     
+    print("\nFirst palindromes above 10**12 (generated, not searched):")
+    first_big = []
+    for palindrome in iterPalindromes(10 ** 12, 10 ** 13):
+        first_big.append(palindrome)
+        if len(first_big) == 5:
+            break
+    print(f"Palindromes: {first_big}")
+    
     print("\nNext palindromes:")
     test_next = [100, 121, 999, 1991]
     for num in test_next:
         next_pal = nextPalindrome(num)
         print(f"Next palindrome after {num}: {next_pal}")
     
+    print("\nPrevious palindromes:")
+    for num in test_next:
+        print(f"Previous palindrome before {num}: {prevPalindrome(num)}")
+    
+    print("\nCounting and indexing palindromes:")
+    print(f"Palindromes in [0, 10**12]: {countPalindromes(0, 10 ** 12)}")
+    print(f"Palindromes in [100, 200]: {countPalindromes(100, 200)}")
+    for k in [1, 10, 11, 100, 10 ** 6]:
+        print(f"Palindrome #{k}: {kthPalindrome(k)}")
+    
     print("\nPerformance Analysis:")
     print("-" * 40)
     print("Method Complexity:")
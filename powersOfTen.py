@@ -0,0 +1,184 @@
+from collections import OrderedDict
+
+# Exponents below this limit come from a dense list grown one step at a time
+_dense_limit = 4096
+_dense = [1]
+
+# 10**(2**j) for j = 0, 1, 2, ... grown by squaring, used to build large powers
+_ladder = [10]
+_ladder_bytes = 0
+
+# Large powers built from the ladder, least recently used first
+_composite = OrderedDict()
+_composite_bytes = 0
+_max_cache_bytes = 64 * 1024 * 1024
+
+_hits = 0
+_misses = 0
+
+
+def _ladderEntry(j, below):
+    # 10**(2**j), given below = 10**(2**(j - 1)); kept only while the ladder
+    # and the composite powers together fit in the cache cap
+    global _ladder_bytes
+    
+    if j < len(_ladder):
+        return _ladder[j]
+    
+    power = below * below
+    size = power.bit_length() // 8
+    if j == len(_ladder) and _ladder_bytes + size <= _max_cache_bytes:
+        _ladder.append(power)
+        _ladder_bytes += size
+        _evict()
+    return power
+
+
+def _evict():
+    # Drop least recently used composite powers, then the highest ladder
+    # rungs, until the cached bytes fit in the cap
+    global _composite_bytes, _ladder_bytes
+    
+    while _composite and _composite_bytes + _ladder_bytes > _max_cache_bytes:
+        _, evicted = _composite.popitem(last=False)
+        _composite_bytes -= evicted.bit_length() // 8
+    while len(_ladder) > 1 and _ladder_bytes > _max_cache_bytes:
+        _ladder_bytes -= _ladder.pop().bit_length() // 8
+
+
+def powerOfTen(k):
+    """
+    Return 10**k from a shared cache that grows on demand.
+    
+    Small exponents are kept in a dense list, so lookups are a list index.
+    Larger ones are multiplied together from the 10**(2**j) ladder and kept
+    in an LRU cache; the ladder and that cache share a size cap (see
+    configure).
+    
+    Args:
+        k (int): Non-negative exponent
+    
+    Returns:
+        int: 10 raised to the power k
+    
+    Raises:
+        ValueError: If k is negative
+    """
+    global _composite_bytes, _hits, _misses
+    
+    if k < 0:
+        raise ValueError("Exponent must be non-negative")
+    
+    if k < len(_dense):
+        return _dense[k]
+    
+    if k < _dense_limit:
+        while len(_dense) <= k:
+            _dense.append(_dense[-1] * 10)
+        return _dense[k]
+    
+    power = _composite.get(k)
+    if power is not None:
+        _hits += 1
+        _composite.move_to_end(k)
+        return power
+    _misses += 1
+    
+    # Multiply the ladder entries of the set bits of k
+    power = 1
+    rung = _ladder[0]
+    j = 0
+    rest = k
+    while True:
+        if rest & 1:
+            power *= rung
+        rest >>= 1
+        if not rest:
+            break
+        j += 1
+        rung = _ladderEntry(j, rung)
+    
+    size = power.bit_length() // 8
+    if _ladder_bytes + size <= _max_cache_bytes:
+        _composite[k] = power
+        _composite_bytes += size
+        _evict()
+    
+    return power
+
+
+def configure(dense_limit=None, max_cache_bytes=None):
+    """
+    Change the cache limits (existing entries above the new limits are
+    dropped).
+    
+    max_cache_bytes caps the 10**(2**j) ladder and the cached large powers
+    together; ladder rungs that would exceed it are computed but not kept.
+    The dense list is bounded separately, by dense_limit.
+    
+    Args:
+        dense_limit (int, optional): Exponents below this use the dense list
+        max_cache_bytes (int, optional): Memory cap for the ladder and the
+            large cached powers
+    """
+    global _dense_limit, _max_cache_bytes
+    
+    if dense_limit is not None:
+        if dense_limit < 1:
+            raise ValueError("dense_limit must be a positive integer")
+        _dense_limit = dense_limit
+        del _dense[dense_limit:]
+    
+    if max_cache_bytes is not None:
+        if max_cache_bytes < 0:
+            raise ValueError("max_cache_bytes must be non-negative")
+        _max_cache_bytes = max_cache_bytes
+        _evict()
+
+
+def cacheInfo():
+    """
+    Report the current cache contents and counters.
+    
+    Returns:
+        dict: Entry counts, cached bytes, limits, hits and misses
+    """
+    return {
+        'dense_entries': len(_dense),
+        'ladder_entries': len(_ladder),
+        'composite_entries': len(_composite),
+        'ladder_bytes': _ladder_bytes,
+        'composite_bytes': _composite_bytes,
+        'dense_limit': _dense_limit,
+        'max_cache_bytes': _max_cache_bytes,
+        'hits': _hits,
+        'misses': _misses,
+    }
+
+
+def clearCache():
+    """
+    Drop every cached power and reset the counters.
+    """
+    global _composite_bytes, _ladder_bytes, _hits, _misses
+    
+    del _dense[1:]
+    del _ladder[1:]
+    _ladder_bytes = 0
+    _composite.clear()
+    _composite_bytes = 0
+    _hits = _misses = 0
+
+
+# Test the functions
+if __name__ == "__main__":
+    print("Testing powerOfTen function:")
+    print("-" * 40)
+    for k in [0, 1, 5, 10, 20]:
+        print(f"powerOfTen({k:2d}) = {powerOfTen(k)}")
+    
+    big = powerOfTen(100000)
+    print(f"\npowerOfTen(100000) has {big.bit_length()} bits")
+    print(f"Matches 10 ** 100000: {big == 10 ** 100000}")
+    powerOfTen(100000)
+    print(f"Cache info: {cacheInfo()}")
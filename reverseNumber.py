@@ -1,3 +1,17 @@
+from array import array
+
+from countDigitsWIthoutStrConv import _integerMagnitudes, countDigitsExact
+from powersOfTen import powerOfTen
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch functions fall back to pure Python
+    np = None
+
+# Below this many digits the digit loop is faster than splitting
+_REVERSE_CUTOFF = 40
+
+
 def reverseNumber(n):
     """
     Reverse the digits of a number without converting to string.
@@ -49,6 +63,103 @@ def reverseNumberRecursive(n, reversed_num=0):
     return reverseNumberRecursive(n // 10, reversed_num * 10 + n % 10)
 
 
+def _reversePadded(n, digits):
+    # Reverse n written with exactly `digits` digits (leading zeros included)
+    if digits <= _REVERSE_CUTOFF:
+        reversed_num = 0
+        for _ in range(digits):
+            reversed_num = reversed_num * 10 + n % 10
+            n //= 10
+        return reversed_num
+    
+    low_digits = digits // 2
+    high, low = divmod(n, powerOfTen(low_digits))
+    # The low half becomes the high part of the result and vice versa
+    return (_reversePadded(low, low_digits) * powerOfTen(digits - low_digits)
+            + _reversePadded(high, digits - low_digits))
+
+
+def reverseNumberFast(n):
+    """
+    Divide-and-conquer reversal for very large numbers.
+    
+    The number is split in half by a cached power of ten, both halves are
+    reversed recursively (keeping the low half's leading zeros, which become
+    trailing digits of the result) and recombined. Recursion depth is only
+    log2 of the digit count. Gives the same result as reverseNumber,
+    including sign handling and dropped trailing zeros.
+    
+    Args:
+        n (int): The number to reverse
+        
+    Returns:
+        int: The number with digits reversed
+    """
+    is_negative = n < 0
+    n = abs(n)
+    
+    if n == 0:
+        return 0
+    
+    reversed_num = _reversePadded(n, countDigitsExact(n))
+    return -reversed_num if is_negative else reversed_num
+
+
+def reverseNumberBatch(values):
+    """
+    Reverse every number of an integer array at once.
+    
+    With NumPy available, all lanes peel one digit per iteration in lockstep
+    (lanes whose remaining value is zero stop changing) while the reversed
+    magnitudes accumulate in uint64, which cannot overflow for 19 digits.
+    Signs follow reverseNumber. Lanes whose value or reversal does not fit
+    in int64 are set to 0 and flagged in the overflow mask so they can be
+    handled with reverseNumber.
+    
+    Args:
+        values (iterable): int64 or uint64 values (list, array.array or
+            NumPy array)
+        
+    Returns:
+        tuple: (reversed values as int64, overflow mask)
+        
+    Raises:
+        ValueError: If the values are not integers
+    """
+    if np is None:
+        results = array('q')
+        overflow = array('B')
+        for n in values:
+            reversed_num = reverseNumber(n)
+            fits = -2 ** 63 <= reversed_num < 2 ** 63
+            results.append(reversed_num if fits else 0)
+            overflow.append(0 if fits else 1)
+        return results, overflow
+    
+    shape = np.shape(values)
+    remaining, negative = _integerMagnitudes(values)
+    
+    # uint64 inputs beyond int64 are left to reverseNumber: their reversal
+    # may not even fit the uint64 accumulator
+    too_large = (remaining > np.uint64(2 ** 63 - 1)) & ~negative
+    remaining[too_large] = 0
+    
+    reversed_mag = np.zeros(remaining.shape, dtype=np.uint64)
+    active = remaining > 0
+    while active.any():
+        reversed_mag = np.where(active, reversed_mag * np.uint64(10) + remaining % np.uint64(10),
+                                reversed_mag)
+        remaining //= np.uint64(10)
+        active = remaining > 0
+    
+    limit = np.where(negative, np.uint64(2 ** 63), np.uint64(2 ** 63 - 1))
+    overflow = (reversed_mag > limit) | too_large
+    reversed_mag[overflow] = 0
+    results = reversed_mag.astype(np.int64)
+    results[negative] = -results[negative]
+    return results.reshape(shape), overflow.reshape(shape)
+
+
 # Test the functions
 if __name__ == "__main__":
     test_cases = [123, 4560, 789, -123, -4560, 0, 7, -7, 1000, 10203]
@@ -63,4 +174,18 @@ if __name__ == "__main__":
     print("-" * 50)
     for num in test_cases:
         result = reverseNumberRecursive(num)
-        print(f"reverseNumberRecursive({num:6d}) = {result:6d}")
\ No newline at end of file
+        print(f"reverseNumberRecursive({num:6d}) = {result:6d}")
+    
+    print("\nTesting reverseNumberFast function:")
+    print("-" * 50)
+    for num in test_cases:
+        result = reverseNumberFast(num)
+        print(f"reverseNumberFast({num:6d}) = {result:6d}")
+    
+    print("\nTesting reverseNumberBatch function:")
+    print("-" * 50)
+    batch = test_cases + [2 ** 63 - 1]
+    results, overflow = reverseNumberBatch(batch)
+    for num, result, flagged in zip(batch, results, overflow):
+        note = " (overflow)" if flagged else ""
+        print(f"reverseNumberBatch({num}) = {int(result)}{note}")
\ No newline at end of file